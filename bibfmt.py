@@ -7,8 +7,10 @@ bibliography.
 import sys
 from io import StringIO
 from argparse import ArgumentParser
-from difflib import ndiff
+from difflib import unified_diff
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 import bibtexparser as bp
 from bibtexparser.bibdatabase import BibDataStringExpression
@@ -43,6 +45,14 @@ UNICODE_TO_LATEX = {key: value
                     for key, value in unicode_to_latex_map.items()
                     if not is_ascii(key)}
 
+# Translation table for str.translate built from the map above.
+#
+# Keys consisting of more than one character are skipped because the
+# replacement works character by character.
+_TRANSLATE = {ord(key): value
+              for key, value in UNICODE_TO_LATEX.items()
+              if len(key) == 1}
+
 def apply_on_expression(x, f):
     '''
     Apply the function f for converting strings to bibtex expressions as
@@ -54,18 +64,19 @@ def apply_on_expression(x, f):
         x.apply_on_strings(f)
     return x
 
+@lru_cache(maxsize=None)
 def cleanup_expression(x):
     '''
     Convert the given string containing unicode symbols into a string with
     latex escapes only.
+
+    Results are cached because many field values (authors, publishers,
+    venues) repeat across entries.
     '''
-    ret = []
-    for char in x:
-        if char in (' ', '{', '}'):
-            ret.append(char)
-        else:
-            ret.append(UNICODE_TO_LATEX.get(char, char))
-    return ''.join(ret)
+    # the translation table only contains non-ascii keys
+    if x.isascii():
+        return x
+    return x.translate(_TRANSLATE)
 
 def cleanup_record(x):
     '''
@@ -109,11 +120,15 @@ def format_bib(path):
     '''
     # read bibliography
     with open(path, "r") as f:
-        db = _fixdb(bp.load(f, _parser()))
+        in_ = f.read()
+
+    db = _fixdb(bp.loads(in_, _parser()))
 
     # write the bibliography
+    out = StringIO()
+    bp.dump(db, out, _writer())
     with open(path, "w") as f:
-        bp.dump(db, f, _writer())
+        f.write(out.getvalue())
 
 def check_bib(path):
     '''
@@ -129,7 +144,12 @@ def check_bib(path):
     out = StringIO()
     bp.dump(db, out, _writer())
 
-    return [x for x in ndiff(in_.splitlines(), out.getvalue().splitlines()) if x[0] != ' ']
+    in_lines = in_.splitlines()
+    out_lines = out.getvalue().splitlines()
+    if in_lines == out_lines:
+        return []
+
+    return list(unified_diff(in_lines, out_lines, path, path, lineterm=''))
 
 
 def run():
@@ -155,13 +175,17 @@ def run():
 
     res = parser.parse_args()
 
+    # the bibliographies are independent and processed in parallel
+    paths = ['krr.bib', 'procs.bib']
+
     if res.command == "format":
-        format_bib('krr.bib')
-        format_bib('procs.bib')
+        with ProcessPoolExecutor(max_workers=len(paths)) as ex:
+            list(ex.map(format_bib, paths))
         return 0
 
     assert res.command == "check"
-    diff = check_bib('krr.bib') + check_bib('procs.bib')
+    with ProcessPoolExecutor(max_workers=len(paths)) as ex:
+        diff = [x for d in ex.map(check_bib, paths) for x in d]
     if diff:
         for x in diff:
             print(x, file=sys.stderr)